@@ -1,30 +1,131 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-import networkx as nx
+from collections import deque
+from array import array
 import yaml
 from pathlib import Path
+import sys
+
+try:
+    # LibYAML bindings, if PyYAML was built with them.
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+
+def _to_csr(size: int, rows: array[int], columns: array[int]) -> tuple[array[int], array[int]]:
+    '''Converts a list of edges to compressed sparse row arrays.
+
+    Returns the pair '(indptr, indices)'. The edges of each row keep
+    their original order.'''
+
+    # Count the edges of each row and take the prefix sums.
+    indptr = array('i', [0]) * (size + 1)
+    for r in rows:
+        indptr[r + 1] += 1
+    for i in range(size):
+        indptr[i + 1] += indptr[i]
+
+    # Put each edge into the next free slot of its row.
+    indices = array('i', [0]) * len(columns)
+    fill = indptr[:-1]
+    for r, c in zip(rows, columns):
+        indices[fill[r]] = c
+        fill[r] += 1
+
+    return indptr, indices
+
+
+
+def _topological_levels(
+    slugs: list[str],
+    children_indptr: array[int], children_indices: array[int],
+    parents_indptr: array[int], parents_indices: array[int]
+) -> array[int]:
+    '''Returns the topological level of each activity of the graph given
+    by its compressed sparse row arrays.
+
+    Raises 'ValueError' naming a cycle if the graph has one.'''
+
+    # Kahn's algorithm: repeatedly remove activities without
+    # unprocessed parents.
+    indptr = parents_indptr
+    indegree = array('i', (e - s for s, e in zip(indptr, indptr[1:])))
+    levels = array('i', [0]) * len(indegree)
+    queue = deque(i for i, d in enumerate(indegree) if d == 0)
+    processed = 0
+
+    while queue:
+        index = queue.popleft()
+        processed += 1
+        child_level = levels[index] + 1
+
+        for child in children_indices[children_indptr[index]:children_indptr[index + 1]]:
+            if levels[child] < child_level:
+                levels[child] = child_level
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                queue.append(child)
+
+    if processed == len(indegree):
+        return levels
+
+    # Every unprocessed activity has an unprocessed parent, so
+    # walking back through such parents must run into a cycle.
+    index = next(i for i, d in enumerate(indegree) if d > 0)
+    path = [index]
+    visited = {index}
+
+    while True:
+        index = next(
+            p for p in parents_indices[parents_indptr[index]:parents_indptr[index + 1]]
+            if indegree[p] > 0
+        )
+        if index in visited:
+            break
+        path.append(index)
+        visited.add(index)
 
+    nodes = [slugs[i] for i in path[path.index(index):]] + [slugs[index]]
+    nodes.reverse()
+    cycle = list(zip(nodes, nodes[1:]))
+    raise ValueError(f'Cycle detected: {cycle}.')
 
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class Activity:
     '''Activity.'''
     
     _slug: str
     title: str
-    description: str = field(default_factory=str)
+    description: str = ''
+    _hash: int = field(init=False, repr=False)
+
+
+    def __post_init__(self) -> None:
+        # Interned slugs of equal activities are the same object, and
+        # the hash is computed only once. YAML keys may also load
+        # as other types, which can't be interned.
+        if type(self._slug) is str:
+            self._slug = sys.intern(self._slug)
+        self._hash = hash(self._slug)
 
 
     def __hash__(self):
-        return hash(self._slug)
+        return self._hash
     
 
     def __eq__(self, other):
 
-        if not isinstance(other, Activity):
+        if other is self:
+            return True
+
+        if type(other) is not Activity:
             return NotImplemented
         
-        return self.slug == other.slug
+        return other._slug == self._slug
     
 
     @property
@@ -46,24 +147,94 @@ class Activity:
 
 @dataclass
 class Activities:
-    '''All activities.'''
+    '''All activities.
+
+    Activities are stored column-wise: the activity with index 'i' has
+    the slug 'slugs[i]', the title 'titles[i]' and the description
+    'descriptions[i]'.
+
+    The graph is stored in compressed sparse row form: the children
+    of activity 'i' are 'children_indices[children_indptr[i]:children_indptr[i + 1]]',
+    and the parents are stored in the same way.'''
+
+    slugs: list[str] = field(default_factory=list[str])
+    titles: list[str] = field(default_factory=list[str])
+    descriptions: list[str] = field(default_factory=list[str])
+    slug_to_index: dict[str, int] = field(default_factory=dict[str, int])
+    children_indptr: array[int] = field(default_factory=lambda: array('i', [0]))
+    children_indices: array[int] = field(default_factory=lambda: array('i'))
+    parents_indptr: array[int] = field(default_factory=lambda: array('i', [0]))
+    parents_indices: array[int] = field(default_factory=lambda: array('i'))
 
-    activities_graph: nx.DiGraph = field(default_factory=nx.DiGraph)
-    slug_to_activity: dict[str, Activity] = field(default_factory=dict[str, Activity])
+    # Topological levels of the activities, computed by a successful
+    # 'validate' or load and reused by 'level'.
+    _levels: array[int] | None = field(default=None, init=False, repr=False, compare=False)
 
     
     def validate(self) -> None:
 
-        if not nx.is_directed_acyclic_graph(self.activities_graph):
-            cycle = nx.find_cycle(self.activities_graph)
-            raise ValueError(f'Cycle detected: {cycle}.')
+        # The storage fields are public and may have been changed since
+        # the last check, so the graph is always checked again.
+        self._levels = _topological_levels(
+            self.slugs,
+            self.children_indptr, self.children_indices,
+            self.parents_indptr, self.parents_indices
+        )
+    
+
+    def _children(self, index: int) -> array[int]:
+        '''Returns the indices of the children of the activity.'''
+
+        indptr = self.children_indptr
+        return self.children_indices[indptr[index]:indptr[index + 1]]
+    
+
+    def _parents(self, index: int) -> array[int]:
+        '''Returns the indices of the parents of the activity.'''
+
+        indptr = self.parents_indptr
+        return self.parents_indices[indptr[index]:indptr[index + 1]]
+    
+
+    def level(self, activity: Activity) -> int:
+        '''Returns the topological level of the activity, i.e. the length
+        of the longest chain of its ancestors.'''
+
+        if self._levels is None:
+            self.validate()
+        assert self._levels is not None
+        return self._levels[self.slug_to_index[activity._slug]]
+    
+
+    def activity(self, slug: str) -> Activity:
+        '''Returns the activity with the given slug.'''
+
+        index = self.slug_to_index[slug]
+        return Activity(slug, self.titles[index], self.descriptions[index])
+    
+
+    def neighbors(self, activity: Activity) -> list[Activity]:
+        '''Returns the children of the activity.'''
+
+        slugs, titles, descriptions = self.slugs, self.titles, self.descriptions
+        return [
+            Activity(slugs[i], titles[i], descriptions[i])
+            for i in self._children(self.slug_to_index[activity._slug])
+        ]
     
 
     def clear(self) -> None:
         '''Clears all activities data.'''
 
-        self.activities_graph.clear()
-        self.slug_to_activity.clear()
+        self.slugs.clear()
+        self.titles.clear()
+        self.descriptions.clear()
+        self.slug_to_index.clear()
+        self.children_indptr = array('i', [0])
+        self.children_indices = array('i')
+        self.parents_indptr = array('i', [0])
+        self.parents_indices = array('i')
+        self._levels = None
         
 
     def load_from_yaml(self, filename: str) -> None:
@@ -71,8 +242,8 @@ class Activities:
 
         path = Path(filename)
 
-        with path.open('r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        # Read the whole file at once and parse it from memory.
+        data = yaml.load(path.read_bytes(), Loader=_Loader)
 
         if not isinstance(data, dict):
             raise ValueError('YAML root must be a mapping.')
@@ -81,43 +252,85 @@ class Activities:
         if not isinstance(activities_data, dict):
             raise ValueError('\'activities\' must be a mapping.')
 
-        # Clear old data.
-        self.clear()
-
-        # Create activities.
-        for slug, item in activities_data.items():
-            if not isinstance(item, dict):
+        # All tables are built in local variables and only replace
+        # the old data once the whole file has been read and checked
+        # for cycles, so a failed load leaves the activities unchanged.
+
+        # 'dict.fromkeys' allocates the table for all slugs at once,
+        # so filling it in never triggers a resize.
+        slug_to_index = dict.fromkeys(activities_data)
+        slugs = list(activities_data)
+        titles: list[str] = []
+        descriptions: list[str] = []
+        add_title = titles.append
+        add_description = descriptions.append
+
+        # Create activities, keeping their parents for the second
+        # stage. 'pending[i]' holds the 'parents' value of activity 'i'.
+        # It is checked in that stage, so that errors in the parents
+        # are reported activity by activity.
+        pending: list = []
+        add_pending = pending.append
+
+        for index, (slug, item) in enumerate(activities_data.items()):
+            if type(item) is not dict:
                 raise ValueError('Each activity must be a mapping.')
 
-            activity = Activity.from_dict(slug, item)
+            # Slugs are keys of a mapping, so they can't repeat.
+            slug_to_index[slug] = index
+            add_title(item['title'])
+            add_description(item.get('description', ''))
 
-            if activity.slug in self.slug_to_activity:
-                raise ValueError(f'Duplicate slug: {activity.slug}.')
+            add_pending(item.get('parents'))
 
-            self.slug_to_activity[activity.slug] = activity
-            self.activities_graph.add_node(activity)
-
-        # Create connections.
-        for slug, item in activities_data.items():
-            parents = item.get('parents', [])
+        # Collect connections as parallel arrays of edge endpoints.
+        edge_parents = array('i')
+        edge_children = array('i')
+        get_index = slug_to_index.get
 
+        for child, parents in enumerate(pending):
             if parents is None:
                 parents = []
 
-            if not isinstance(parents, list):
+            if type(parents) is not list:
                 raise ValueError(
-                    f'\'parents\' of \'{slug}\' must be a list.'
+                    f'\'parents\' of \'{slugs[child]}\' must be a list.'
                 )
 
-            child = self.slug_to_activity[slug]
+            # A parent listed more than once still gives a single edge.
+            for parent_slug in dict.fromkeys(parents):
+                parent = get_index(parent_slug)
 
-            for parent_slug in parents:
-                if parent_slug not in self.slug_to_activity:
+                if parent is None:
                     raise ValueError(
-                        f'Unknown parent \'{parent_slug}\' for activity \'{slug}\'.'
+                        f'Unknown parent \'{parent_slug}\' for activity \'{slugs[child]}\'.'
                     )
 
-                parent = self.slug_to_activity[parent_slug]
-                self.activities_graph.add_edge(parent, child)
+                edge_parents.append(parent)
+                edge_children.append(child)
+
+        # Create connections.
+        children_indptr, children_indices = _to_csr(
+            len(pending), edge_parents, edge_children
+        )
+        parents_indptr, parents_indices = _to_csr(
+            len(pending), edge_children, edge_parents
+        )
+
+        # Reject cycles before anything is replaced.
+        levels = _topological_levels(
+            slugs,
+            children_indptr, children_indices,
+            parents_indptr, parents_indices
+        )
 
-        self.validate()
\ No newline at end of file
+        # Replace the old data.
+        self._levels = levels
+        self.slugs = slugs
+        self.titles = titles
+        self.descriptions = descriptions
+        self.slug_to_index = slug_to_index
+        self.children_indptr = children_indptr
+        self.children_indices = children_indices
+        self.parents_indptr = parents_indptr
+        self.parents_indices = parents_indices
@@ -1,7 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from functools import total_ordering
-from typing import overload
+from functools import lru_cache
+from itertools import pairwise
+from operator import attrgetter
+from bisect import bisect_right
+from typing import overload, Iterable, ClassVar
 from enum import Enum, auto
 import datetime
 import zoneinfo
@@ -10,8 +13,52 @@ import sys
 
 
 
-@dataclass(frozen=True)
-@total_ordering
+_UTC = zoneinfo.ZoneInfo('Etc/UTC')    # UTC time zone.
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=_UTC)    # Unix epoch.
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+_INF = float('inf')
+
+# 'datetime.fromisoformat' accepts the suffix 'Z' only since Python 3.11.
+_Z_SUFFIX_UNSUPPORTED = sys.version_info < (3, 11)
+
+# Properties of the kinds of 'TimeInterval', packed as bits of one
+# integer so that each check is a bitwise 'and'. They live at module
+# level, so that methods read them as globals.
+_BOUNDED = 1
+_LEFT_BOUNDED = 2
+_RIGHT_BOUNDED = 4
+_START_SPECIFIED = 8
+_END_SPECIFIED = 16
+_START_INCLUDED = 32
+_END_INCLUDED = 64
+_OPEN = 128
+_CLOSED = 256    # In a mathematical sense, non-openness does not mean closedness.
+
+_ALL_FLAGS = (
+    _BOUNDED | _LEFT_BOUNDED | _RIGHT_BOUNDED | _START_SPECIFIED | _END_SPECIFIED
+    | _START_INCLUDED | _END_INCLUDED | _OPEN | _CLOSED
+)
+
+# Key functions reading the boundary keys of a 'TimeInterval'.
+_by_start_key = attrgetter('_start_key')
+_by_end_key = attrgetter('_end_key')
+
+
+
+@lru_cache(maxsize=512)
+def _zone(timezone_iana: str) -> zoneinfo.ZoneInfo:
+    '''Returns the 'ZoneInfo' time zone with the given IANA name.
+
+    Repeated names share one instance without going through
+    the 'ZoneInfo' constructor again.'''
+
+    return zoneinfo.ZoneInfo(timezone_iana)
+
+
+
+@dataclass(frozen=True, slots=True)
 class Timestamp:
     '''Local date and time along with the time zone.
 
@@ -19,6 +66,10 @@ class Timestamp:
 
     Requirements:
     - 'tzinfo' must be 'zoneinfo.ZoneInfo'.
+    - The moment converted to UTC must lie between 'datetime.min'
+      and 'datetime.max'. This excludes a few hours at either end
+      of the range of local times, e.g. '0001-01-01T00:00' in
+      'Asia/Tokyo'; such timestamps raise 'ValueError'.
 
     Notes:
     - This class strictly stores 'tzinfo' as 'zoneinfo.ZoneInfo'
@@ -26,10 +77,27 @@ class Timestamp:
     - Dependency: 'tzlocal' (for detecting local IANA zone name).'''
 
 
-    _UTC = zoneinfo.ZoneInfo('Etc/UTC')    # UTC time zone.
+    _UTC = _UTC    # Kept for code that refers to it via the class.
 
 
     _dt: datetime.datetime
+
+    # The same moment converted to UTC, computed once on creation.
+    _dt_utc: datetime.datetime = field(init=False, repr=False, compare=False)
+
+    # The IANA name of the time zone, read once on creation.
+    _tz_key: str = field(init=False, repr=False, compare=False)
+
+    # The exact number of microseconds since the Unix epoch, computed
+    # once on creation.
+    _us: int = field(init=False, repr=False, compare=False)
+
+    # ISO 8601 strings, computed on first use.
+    _iso: str | None = field(default=None, init=False, repr=False, compare=False)
+    _utc_iso: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    # The string representation, computed on first use.
+    _str: str | None = field(default=None, init=False, repr=False, compare=False)
     
 
     @staticmethod
@@ -49,10 +117,57 @@ class Timestamp:
     def __post_init__(self) -> None:
         if not Timestamp._is_valid_dt(self._dt):
             raise ValueError('The time zone has been set incorrectly.')
+
+        if self._dt.tzinfo is _UTC:
+            dt_utc = self._dt
+        else:
+            try:
+                dt_utc = self._dt.astimezone(_UTC)
+            except OverflowError as e:
+                # Local times near 'datetime.min' and 'datetime.max'
+                # may lie outside the range of UTC datetimes.
+                raise ValueError(
+                    'The timestamp is out of the supported range in UTC.'
+                ) from e
+        object.__setattr__(self, '_dt_utc', dt_utc)
+        object.__setattr__(self, '_us', (dt_utc - _EPOCH) // _MICROSECOND)
+        object.__setattr__(self, '_tz_key', self._dt.tzinfo.key)    # type: ignore[union-attr]
+
+
+    @classmethod
+    def _from_utc_dt(cls, dt_utc: datetime.datetime) -> Timestamp:
+        '''Creates a timestamp from a datetime whose 'tzinfo' is '_UTC'
+        without validating it.
+
+        Only for internal use, when the datetime is known to be
+        in '_UTC'.'''
+
+        timestamp = object.__new__(cls)
+        object.__setattr__(timestamp, '_dt', dt_utc)
+        object.__setattr__(timestamp, '_dt_utc', dt_utc)
+        object.__setattr__(timestamp, '_tz_key', _UTC.key)
+        object.__setattr__(timestamp, '_us', (dt_utc - _EPOCH) // _MICROSECOND)
+        object.__setattr__(timestamp, '_iso', None)
+        object.__setattr__(timestamp, '_utc_iso', None)
+        object.__setattr__(timestamp, '_str', None)
+        return timestamp
         
     
     def __str__(self) -> str:
-        return f'{self.datetime_iso}, {self.timezone_iana}'
+        string = self._str
+        if string is None:
+            string = f'{self.datetime_iso}, {self._tz_key}'
+            object.__setattr__(self, '_str', string)
+
+        return string
+    
+
+    def __format__(self, format_spec: str) -> str:
+        # Used by f-strings, e.g. in 'TimeInterval.__str__'.
+        if format_spec:
+            return object.__format__(self, format_spec)
+        
+        return self.__str__()
     
 
     def __eq__(self, other: object) -> bool:
@@ -61,12 +176,11 @@ class Timestamp:
         if not isinstance(other, Timestamp):
             return NotImplemented
         
-        return self._dt.astimezone(Timestamp._UTC) == other._dt.astimezone(Timestamp._UTC)
+        return self._us == other._us
     
 
     def __hash__(self) -> int:
-        dt_utc = self._dt.astimezone(Timestamp._UTC)
-        return hash(dt_utc)
+        return hash(self._us)
     
 
     def __lt__(self, other: object) -> bool:
@@ -75,7 +189,38 @@ class Timestamp:
         if not isinstance(other, Timestamp):
             return NotImplemented
         
-        return self._dt.astimezone(Timestamp._UTC) < other._dt.astimezone(Timestamp._UTC)
+        return self._us < other._us
+    
+
+    # The remaining comparisons are written out rather than derived
+    # by 'total_ordering', which would call two of the above.
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+        
+        return self._us != other._us
+    
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+        
+        return self._us <= other._us
+    
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+        
+        return self._us > other._us
+    
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+        
+        return self._us >= other._us
     
 
     def __add__(self, other: datetime.timedelta) -> Timestamp:
@@ -85,10 +230,16 @@ class Timestamp:
             return NotImplemented
 
         tz = self._dt.tzinfo
-        dt_utc = self._dt.astimezone(Timestamp._UTC)
-        dt_utc_new = dt_utc + other
-        dt_new = dt_utc_new.astimezone(tz)
-        return Timestamp(dt_new)
+        dt_utc_new = self._dt_utc + other
+
+        if tz is _UTC:
+            # Nothing to convert back.
+            return Timestamp._from_utc_dt(dt_utc_new)
+
+        # Adding to the local datetime directly would be wall-clock
+        # arithmetic and go wrong across DST transitions, so the shift
+        # is done in UTC.
+        return Timestamp(dt_utc_new.astimezone(tz))
     
 
     @overload
@@ -107,27 +258,69 @@ class Timestamp:
             return self + (-other)
 
         if isinstance(other, Timestamp):
-            self_dt_utc = self._dt.astimezone(Timestamp._UTC)
-            other_dt_utc = other._dt.astimezone(Timestamp._UTC)
-            return self_dt_utc - other_dt_utc    # 'timedelta'.
+            return self._dt_utc - other._dt_utc    # 'timedelta'.
 
         return NotImplemented
     
 
-    @classmethod
-    def from_utc(cls, dt_iso: str) -> Timestamp:
-        '''Parse an ISO 8601 string and return a 'Timestamp' in UTC.
+    @staticmethod
+    def _fast_parse_utc_iso(dt_iso: str) -> datetime.datetime | None:
+        '''Parses the most common shapes 'YYYY-MM-DDTHH:MM:SS',
+        'YYYY-MM-DDTHH:MM:SSZ' and 'YYYY-MM-DDTHH:MM:SS+00:00' by slicing
+        the fields at their fixed positions.
+        
+        Returns 'None' for any other string, which is then left
+        to the general parser.'''
+
+        n = len(dt_iso)
+        if n == 19:
+            pass
+        elif n == 20:
+            if dt_iso[19] != 'Z':
+                return None
+        elif n == 25:
+            if dt_iso[19:] != '+00:00':
+                return None
+        else:
+            return None
 
-        Any strings containing timestamps with a non-zero offset are rejected.
+        if not (
+            dt_iso[4] == '-' and dt_iso[7] == '-' and dt_iso[10] == 'T'
+            and dt_iso[13] == ':' and dt_iso[16] == ':'
+        ):
+            return None
 
-        Accepted examples:
-         - '2026-01-20T10:36'         (assumed UTC),
-         - '2026-01-20T10:36Z'        (UTC),
-         - '2026-01-20T10:36+00:00'   (zero offset).'''
+        fields = (
+            dt_iso[0:4], dt_iso[5:7], dt_iso[8:10],
+            dt_iso[11:13], dt_iso[14:16], dt_iso[17:19]
+        )
+        # 'int' would also accept signs, underscores and non-ASCII digits.
+        for f in fields:
+            if not (f.isascii() and f.isdigit()):
+                return None
+
+        try:
+            return datetime.datetime(*map(int, fields), tzinfo=_UTC)
+        except ValueError:
+            # Out-of-range fields; the general parser reports them.
+            return None
+    
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_utc_iso(dt_iso: str) -> datetime.datetime:
+        '''Parses an ISO 8601 string into an aware UTC datetime.
+
+        The results are cached, since the same strings tend to be parsed
+        again and again. See 'from_utc' for the accepted formats.'''
         
+        dt = Timestamp._fast_parse_utc_iso(dt_iso)
+        if dt is not None:
+            return dt
+
         # Manually replace the suffix 'Z' with zero offset '+00:00'
         # for older versions of Python (< 3.11).
-        if sys.version_info < (3, 11) and dt_iso.endswith('Z'):
+        if _Z_SUFFIX_UNSUPPORTED and dt_iso.endswith('Z'):
             dt_iso = dt_iso[:-1] + '+00:00'
         
         try:
@@ -137,16 +330,30 @@ class Timestamp:
 
         if dt.tzinfo is None:
             # Naive: interpret as UTC per method contract.
-            dt = dt.replace(tzinfo=Timestamp._UTC)
+            dt = dt.replace(tzinfo=_UTC)
         else:
             # Ensure the moment is UTC (offset zero).
             if dt.utcoffset() != datetime.timedelta(0):
                 raise ValueError(f"The timestamp '{dt_iso}' is not in UTC.")
             # Convert to 'ZoneInfo('Etc/UTC')' to satisfy strict storage
-            # invariant.
-            dt = dt.astimezone(Timestamp._UTC)
+            # invariant. The offset is zero, so only 'tzinfo' changes.
+            dt = dt.replace(tzinfo=_UTC)
+
+        return dt
+    
+
+    @classmethod
+    def from_utc(cls, dt_iso: str) -> Timestamp:
+        '''Parse an ISO 8601 string and return a 'Timestamp' in UTC.
+
+        Any strings containing timestamps with a non-zero offset are rejected.
+
+        Accepted examples:
+         - '2026-01-20T10:36'         (assumed UTC),
+         - '2026-01-20T10:36Z'        (UTC),
+         - '2026-01-20T10:36+00:00'   (zero offset).'''
 
-        return cls(dt)
+        return cls._from_utc_dt(Timestamp._parse_utc_iso(dt_iso))
     
 
     @classmethod
@@ -154,7 +361,7 @@ class Timestamp:
         '''Creates a new timestamp with the current local time.'''
 
         try:
-            tz = zoneinfo.ZoneInfo(tzlocal.get_localzone_name())
+            tz = _zone(tzlocal.get_localzone_name())
             return cls(datetime.datetime.now(tz))
         except Exception as e:
             raise RuntimeError(
@@ -167,7 +374,7 @@ class Timestamp:
         '''Creates a new timestamp with the current time in UTC.'''
         
         try:
-            return cls(datetime.datetime.now(Timestamp._UTC))
+            return cls._from_utc_dt(datetime.datetime.now(_UTC))
         except Exception as e:
             raise RuntimeError('Failed to determine UTC time.') from e
     
@@ -182,17 +389,20 @@ class Timestamp:
         '''Returns the timestamp in ISO 8601 format in the time zone
         in which it was recorded.'''
         
-        return self._dt.isoformat()
+        iso = self._iso
+        if iso is None:
+            iso = self._dt.isoformat()
+            object.__setattr__(self, '_iso', iso)
+
+        return iso
     
 
     @property
     def timezone_iana(self) -> str:
         '''Returns the time zone of this timestamp in IANA format.'''
 
-        if not isinstance(self._dt.tzinfo, zoneinfo.ZoneInfo):
-            raise ValueError('The time zone has been set incorrectly.')
-
-        return self._dt.tzinfo.key
+        # The time zone has been validated on creation.
+        return self._tz_key
     
 
     def to_timezone(self, timezone_iana: str) -> Timestamp:
@@ -200,7 +410,7 @@ class Timestamp:
         the specified time zone.'''
 
         try:
-            tz = zoneinfo.ZoneInfo(timezone_iana)
+            tz = _zone(timezone_iana)
         except Exception as e:
             # 'ZoneInfo' raises 'ZoneInfoNotFoundError' (subclass
             # of Exception) on bad names.
@@ -214,20 +424,23 @@ class Timestamp:
         '''Creates a new timestamp by converting the given one
         to UTC.'''
         
-        dt_utc = self._dt.astimezone(Timestamp._UTC)
-        return Timestamp(dt_utc)
+        return Timestamp._from_utc_dt(self._dt_utc)
     
 
     @property
     def utc_iso(self) -> str:
         '''Returns an ISO 8601 string in UTC.'''
     
-        dt_utc = self._dt.astimezone(Timestamp._UTC)
-        return dt_utc.replace(tzinfo=None).isoformat() + 'Z'
+        utc_iso = self._utc_iso
+        if utc_iso is None:
+            utc_iso = self._dt_utc.replace(tzinfo=None).isoformat() + 'Z'
+            object.__setattr__(self, '_utc_iso', utc_iso)
 
+        return utc_iso
 
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TimeInterval:
     '''A time interval. Represents a connected subset of the time axis.
 
@@ -271,87 +484,99 @@ class TimeInterval:
         TIMELINE = auto()        # The entire timeline.
     
 
-    _BOUNDED_KINDS = {
-        Kind.EMPTY,
-        Kind.POINT,
-        Kind.OPEN,
-        Kind.CLOSED,
-        Kind.CLOSED_OPEN,
-        Kind.OPEN_CLOSED,
-    }
-
-    _LEFT_BOUNDED_KINDS = {
-        Kind.EMPTY,
-        Kind.POINT,
-        Kind.OPEN,
-        Kind.CLOSED,
-        Kind.CLOSED_OPEN,
-        Kind.OPEN_CLOSED,
-        Kind.RIGHT_OPEN,
-        Kind.RIGHT_CLOSED
+    # The property bits of each kind. Every interval keeps the flags
+    # of its kind in '_flags'.
+    _FLAGS = {
+        Kind.EMPTY: _BOUNDED | _LEFT_BOUNDED | _RIGHT_BOUNDED | _OPEN | _CLOSED,
+        Kind.POINT: (
+            _BOUNDED | _LEFT_BOUNDED | _RIGHT_BOUNDED | _CLOSED
+            | _START_SPECIFIED | _END_SPECIFIED | _START_INCLUDED | _END_INCLUDED
+        ),
+        Kind.OPEN: (
+            _BOUNDED | _LEFT_BOUNDED | _RIGHT_BOUNDED | _OPEN
+            | _START_SPECIFIED | _END_SPECIFIED
+        ),
+        Kind.CLOSED: (
+            _BOUNDED | _LEFT_BOUNDED | _RIGHT_BOUNDED | _CLOSED
+            | _START_SPECIFIED | _END_SPECIFIED | _START_INCLUDED | _END_INCLUDED
+        ),
+        Kind.CLOSED_OPEN: (
+            _BOUNDED | _LEFT_BOUNDED | _RIGHT_BOUNDED
+            | _START_SPECIFIED | _END_SPECIFIED | _START_INCLUDED
+        ),
+        Kind.OPEN_CLOSED: (
+            _BOUNDED | _LEFT_BOUNDED | _RIGHT_BOUNDED
+            | _START_SPECIFIED | _END_SPECIFIED | _END_INCLUDED
+        ),
+        Kind.RIGHT_OPEN: _LEFT_BOUNDED | _OPEN | _START_SPECIFIED,
+        Kind.RIGHT_CLOSED: _LEFT_BOUNDED | _CLOSED | _START_SPECIFIED | _START_INCLUDED,
+        Kind.LEFT_OPEN: _RIGHT_BOUNDED | _OPEN | _END_SPECIFIED,
+        Kind.LEFT_CLOSED: _RIGHT_BOUNDED | _CLOSED | _END_SPECIFIED | _END_INCLUDED,
+        Kind.TIMELINE: _OPEN | _CLOSED,
     }
 
-    _RIGHT_BOUNDED_KINDS = {
-        Kind.EMPTY,
-        Kind.POINT,
-        Kind.OPEN,
-        Kind.CLOSED,
-        Kind.CLOSED_OPEN,
-        Kind.OPEN_CLOSED,
-        Kind.LEFT_OPEN,
-        Kind.LEFT_CLOSED
+    # Checks of the boundaries '(start, end)' for each kind.
+    _VALIDATORS = {
+        Kind.EMPTY: lambda s, e: s is None and e is None,
+        Kind.POINT: lambda s, e: s is not None and e is not None and s == e,
+        Kind.OPEN: lambda s, e: s is not None and e is not None and s < e,
+        Kind.CLOSED: lambda s, e: s is not None and e is not None and s < e,    # Not a point.
+        Kind.CLOSED_OPEN: lambda s, e: s is not None and e is not None and s < e,
+        Kind.OPEN_CLOSED: lambda s, e: s is not None and e is not None and s < e,
+        Kind.RIGHT_OPEN: lambda s, e: s is not None and e is None,
+        Kind.RIGHT_CLOSED: lambda s, e: s is not None and e is None,
+        Kind.LEFT_OPEN: lambda s, e: s is None and e is not None,
+        Kind.LEFT_CLOSED: lambda s, e: s is None and e is not None,
+        Kind.TIMELINE: lambda s, e: s is None and e is None,
     }
 
-    _OPEN_KINDS = {
-        Kind.EMPTY,
-        Kind.OPEN,
-        Kind.RIGHT_OPEN,
-        Kind.LEFT_OPEN,
-        Kind.TIMELINE
+    # The kind of a non-empty interval by the specified and included
+    # bits of its boundaries. A closed interval with equal boundaries
+    # is a point.
+    _KINDS_BY_BOUNDARIES = {
+        _START_SPECIFIED | _END_SPECIFIED: Kind.OPEN,
+        _START_SPECIFIED | _END_SPECIFIED | _START_INCLUDED | _END_INCLUDED: Kind.CLOSED,
+        _START_SPECIFIED | _END_SPECIFIED | _START_INCLUDED: Kind.CLOSED_OPEN,
+        _START_SPECIFIED | _END_SPECIFIED | _END_INCLUDED: Kind.OPEN_CLOSED,
+        _START_SPECIFIED: Kind.RIGHT_OPEN,
+        _START_SPECIFIED | _START_INCLUDED: Kind.RIGHT_CLOSED,
+        _END_SPECIFIED: Kind.LEFT_OPEN,
+        _END_SPECIFIED | _END_INCLUDED: Kind.LEFT_CLOSED,
+        0: Kind.TIMELINE,
     }
 
-    # In a mathematical sense, non-openness does not mean closedness.
-    _CLOSED_KINDS = {
-        Kind.EMPTY,
-        Kind.POINT,
-        Kind.CLOSED,
-        Kind.RIGHT_CLOSED,
-        Kind.LEFT_CLOSED,
-        Kind.TIMELINE
+    # Builders of the string representation for each kind.
+    _FORMATTERS = {
+        Kind.EMPTY: lambda i: '\u2205',    # The empty set symbol.
+        Kind.POINT: lambda i: f'{{{i._start}}}',
+        Kind.OPEN: lambda i: f'({i._start}; {i._end})',
+        Kind.CLOSED: lambda i: f'[{i._start}; {i._end}]',
+        Kind.CLOSED_OPEN: lambda i: f'[{i._start}; {i._end})',
+        Kind.OPEN_CLOSED: lambda i: f'({i._start}; {i._end}]',
+        Kind.RIGHT_OPEN: lambda i: f'({i._start}; +\u221E)',
+        Kind.RIGHT_CLOSED: lambda i: f'[{i._start}; +\u221E)',
+        Kind.LEFT_OPEN: lambda i: f'(-\u221E; {i._end})',
+        Kind.LEFT_CLOSED: lambda i: f'(-\u221E; {i._end}]',
+        Kind.TIMELINE: lambda i: '(-\u221E; +\u221E)',
     }
 
-    _START_SPECIFIED_KINDS = {
-        Kind.POINT,
-        Kind.OPEN,
-        Kind.CLOSED,
-        Kind.CLOSED_OPEN,
-        Kind.OPEN_CLOSED,
-        Kind.RIGHT_OPEN,
-        Kind.RIGHT_CLOSED
+    # The kinds of the closure and the interior for the kinds that are
+    # not closed and not open, respectively. The boundaries stay
+    # the same.
+    _CLOSURE_KINDS = {
+        Kind.OPEN: Kind.CLOSED,
+        Kind.CLOSED_OPEN: Kind.CLOSED,
+        Kind.OPEN_CLOSED: Kind.CLOSED,
+        Kind.RIGHT_OPEN: Kind.RIGHT_CLOSED,
+        Kind.LEFT_OPEN: Kind.LEFT_CLOSED,
     }
-
-    _END_SPECIFIED_KINDS = {
-        Kind.POINT,
-        Kind.OPEN,
-        Kind.CLOSED,
-        Kind.CLOSED_OPEN,
-        Kind.OPEN_CLOSED,
-        Kind.LEFT_OPEN,
-        Kind.LEFT_CLOSED
-    }
-
-    _START_INCLUDED_KINDS = {
-        Kind.POINT,
-        Kind.CLOSED,
-        Kind.CLOSED_OPEN,
-        Kind.RIGHT_CLOSED
-    }
-
-    _END_INCLUDED_KINDS = {
-        Kind.POINT,
-        Kind.CLOSED,
-        Kind.OPEN_CLOSED,
-        Kind.LEFT_CLOSED
+    _INTERIOR_KINDS = {
+        Kind.POINT: Kind.EMPTY,
+        Kind.CLOSED: Kind.OPEN,
+        Kind.CLOSED_OPEN: Kind.OPEN,
+        Kind.OPEN_CLOSED: Kind.OPEN,
+        Kind.RIGHT_CLOSED: Kind.RIGHT_OPEN,
+        Kind.LEFT_CLOSED: Kind.LEFT_OPEN,
     }
 
 
@@ -359,92 +584,117 @@ class TimeInterval:
     _start: Timestamp | None = None
     _end: Timestamp | None = None
 
+    # The '_FLAGS' of the kind, read once on creation.
+    _flags: int = field(init=False, repr=False, compare=False)
 
-    def _is_valid(self) -> bool:
-        '''Checks whether the time interval is set correctly.'''
+    # The boundaries packed into integers that order them together
+    # with their inclusion, computed once on creation:
+    # - '_start_key' is '2 * us' for an included start and '2 * us + 1'
+    #   for an excluded one, or '-inf' if the start is not specified;
+    # - '_end_key' is '2 * us + 1' for an included end and '2 * us'
+    #   for an excluded one, or '+inf' if the end is not specified.
+    # Here 'us' is '_us' of the boundary. Then for non-empty intervals
+    # 'a' and 'b', 'a' lies to the left of 'b' exactly when
+    # 'a._end_key <= b._start_key', disconnectedly so when
+    # 'a._end_key < b._start_key'. The empty interval has the keys
+    # '+inf' and '-inf'.
+    _start_key: int | float = field(init=False, repr=False, compare=False)
+    _end_key: int | float = field(init=False, repr=False, compare=False)
 
-        match self._kind:
-            case TimeInterval.Kind.EMPTY:
-                return self._start is None and self._end is None
+    # The duration in microseconds, or 'None' if it is not defined,
+    # computed once on creation.
+    _duration_us: int | None = field(init=False, repr=False, compare=False)
 
-            case TimeInterval.Kind.POINT:
-                return (
-                    self._start is not None
-                    and self._end is not None
-                    and self._start == self._end
-                )
+    # The string representation, computed on first use.
+    _str: str | None = field(default=None, init=False, repr=False, compare=False)
 
-            case (
-                TimeInterval.Kind.OPEN |
-                TimeInterval.Kind.CLOSED |    # Not a point.
-                TimeInterval.Kind.CLOSED_OPEN |
-                TimeInterval.Kind.OPEN_CLOSED
-            ):
-                return (
-                    self._start is not None
-                    and self._end is not None
-                    and self._start < self._end
-                )
-            
-            case TimeInterval.Kind.RIGHT_OPEN | TimeInterval.Kind.RIGHT_CLOSED:
-                return self._start is not None and self._end is None
-            
-            case TimeInterval.Kind.LEFT_OPEN | TimeInterval.Kind.LEFT_CLOSED:
-                return self._start is None and self._end is not None
+    # Shared instances of the intervals without boundaries. They are
+    # created once the class is defined.
+    _EMPTY: ClassVar[TimeInterval]
+    _TIMELINE: ClassVar[TimeInterval]
 
-            case TimeInterval.Kind.TIMELINE:
-                return self._start is None and self._end is None
 
-        return False
+    def _is_valid(self) -> bool:
+        '''Checks whether the time interval is set correctly.'''
+
+        validator = TimeInterval._VALIDATORS.get(self._kind)
+        return validator is not None and validator(self._start, self._end)
 
     
     def __post_init__(self) -> None:
 
         if not self._is_valid():
             raise ValueError('The time interval has been set incorrectly.')
-        
 
-    def __str__(self) -> str:
+        self._init_cached()
 
-        match self._kind:
-            case TimeInterval.Kind.EMPTY:
-                # Returns the empty set symbol. 
-                return '\u2205'
 
-            case TimeInterval.Kind.POINT:
-                return f'{{{self._start}}}'
+    def _init_cached(self) -> None:
+        '''Sets the fields derived from the kind and the boundaries.'''
 
-            case TimeInterval.Kind.OPEN:
-                return f'({self._start}; {self._end})'
+        kind, start, end = self._kind, self._start, self._end
+        flags = TimeInterval._FLAGS[kind]
 
-            case TimeInterval.Kind.CLOSED:
-                return f'[{self._start}; {self._end}]'
-            
-            case TimeInterval.Kind.CLOSED_OPEN:
-                return f'[{self._start}; {self._end})'
+        if kind is TimeInterval.Kind.EMPTY:
+            start_key: int | float = _INF
+            end_key: int | float = -_INF
+            duration_us: int | None = 0
+        else:
+            if start is None:
+                start_key = -_INF
+            elif flags & _START_INCLUDED:
+                start_key = 2 * start._us
+            else:
+                start_key = 2 * start._us + 1
 
-            case TimeInterval.Kind.OPEN_CLOSED:
-                return f'({self._start}; {self._end}]'
-            
-            case TimeInterval.Kind.RIGHT_OPEN:
-                return f'({self._start}; +\u221E)'
+            if end is None:
+                end_key = _INF
+            elif flags & _END_INCLUDED:
+                end_key = 2 * end._us + 1
+            else:
+                end_key = 2 * end._us
 
-            case TimeInterval.Kind.RIGHT_CLOSED:
-                return f'[{self._start}; +\u221E)'
+            if start is None or end is None:
+                duration_us = None
+            else:
+                duration_us = end._us - start._us
 
-            case TimeInterval.Kind.LEFT_OPEN:
-                return f'(-\u221E; {self._end})'
+        object.__setattr__(self, '_flags', flags)
+        object.__setattr__(self, '_start_key', start_key)
+        object.__setattr__(self, '_end_key', end_key)
+        object.__setattr__(self, '_duration_us', duration_us)
+        
 
-            case TimeInterval.Kind.LEFT_CLOSED:
-                return f'(-\u221E; {self._end}]'
-            
-            case TimeInterval.Kind.TIMELINE:
-                return '(-\u221E; +\u221E)'
+    @classmethod
+    def _unchecked(
+        cls,
+        kind: TimeInterval.Kind,
+        start: Timestamp | None = None,
+        end: Timestamp | None = None
+    ) -> TimeInterval:
+        '''Creates a time interval without validating it.
 
-        raise AssertionError(f'Unhandled \'TimeInterval.Kind\': {self._kind}.')
+        Only for internal use, when the boundaries are already known
+        to match the kind.'''
 
-        
+        interval = object.__new__(cls)
+        object.__setattr__(interval, '_kind', kind)
+        object.__setattr__(interval, '_start', start)
+        object.__setattr__(interval, '_end', end)
+        object.__setattr__(interval, '_str', None)
+        interval._init_cached()
+        return interval
+
+
+    def __str__(self) -> str:
+        string = self._str
+        if string is None:
+            string = TimeInterval._FORMATTERS[self._kind](self)
+            object.__setattr__(self, '_str', string)
+
+        return string
     
+
     def __bool__(self) -> bool:
         '''Checks whether the interval is non-empty.'''
 
@@ -453,8 +703,10 @@ class TimeInterval:
 
     def __contains__(self, other: object) -> bool:
         
-        if isinstance(other, Timestamp | TimeInterval):
-            return self.contains(other)
+        if isinstance(other, Timestamp):
+            return self._start_key <= 2 * other._us < self._end_key
+        elif isinstance(other, TimeInterval):
+            return self.contains_timeinterval(other)
         else:
             return False
     
@@ -462,132 +714,76 @@ class TimeInterval:
     def __and__(self, other: TimeInterval) -> TimeInterval:
         '''The intersection of two time intervals.'''
 
-        # Quick checks for empty/timeline.
-        if self.is_empty or other.is_empty:
-            # An intersection with an empty interval is empty.
-            return TimeInterval.empty()
-        if self.is_timeline:
-            return other
-        if other.is_timeline:
-            return self
-        # From this point onwards, intervals are considered to be
-        # non-empty and not to be the entire timeline.
-
-        # Calculating the start of the intersection.
-        if self.is_start_specified and other.is_start_specified:
-            # The start of each interval is explicitly specified
-            # (neither lies at infinity).
-
-            # Calculating the start of the intersection.
-            assert self.start is not None
-            assert other.start is not None
-            new_start = max(self.start, other.start)
-
-            # Calculating whether or not the start is included
-            # in the intersection.
-            assert self.is_start_included is not None
-            assert other.is_start_included is not None
-            if self.start < other.start:
-                new_start_included = other.is_start_included
-            elif self.start > other.start:
-                new_start_included = self.is_start_included
-            else:
-                new_start_included = self.is_start_included and other.is_start_included
-        elif not self.is_start_specified and not other.is_start_specified:
-            # The start of each interval is not specified (they lie
-            # at infinity).
-            
-            new_start = None
-            new_start_included = None
-        else:
-            # Only the start of one of the intervals is specified
-            # (it doesn't lie at infinity).
-
-            # Calculating the start of the intersection.
-            new_start = self.start or other.start
-
-            # Calculating whether or not the start is included
-            # in the intersection.
-            new_start_included = (
-                self.is_start_included
-                if self.is_start_specified
-                else other.is_start_included
-            )        
-
-        # Calculating the end of the intersection.
-        if self.is_end_specified and other.is_end_specified:
-            # The end of each interval is explicitly specified
-            # (neither lies at infinity).
-
-            # Calculating the end of the intersection.
-            assert self.end is not None
-            assert other.end is not None
-            new_end = min(self.end, other.end)
-
-            # Calculating whether or not the end is included
-            # in the intersection.
-            assert self.is_end_included is not None
-            assert other.is_end_included is not None
-            if self.end < other.end:
-                new_end_included = self.is_end_included
-            elif self.end > other.end:
-                new_end_included = other.is_end_included
-            else:
-                new_end_included = self.is_end_included and other.is_end_included
-        elif not self.is_end_specified and not other.is_end_specified:
-            # The end of each interval is not specified (they lie
-            # at infinity).
-            
-            new_end = None
-            new_end_included = None
-        else:
-            # Only the end of one of the intervals is specified
-            # (it doesn't lie at infinity).
-
-            # Calculating the end of the intersection.
-            new_end = self.end or other.end
-
-            # Calculating whether or not the end is included
-            # in the intersection.
-            new_end_included = (
-                self.is_end_included
-                if self.is_end_specified
-                else other.is_end_included
-            )  
-
-        # Checking the resulting intersection for emptiness.
-        if new_start is not None and new_end is not None:
-            # The start and end of the intersection are clearly
-            # specified, i.e. they do not lie at infinity.
-            if new_start_included is True and new_end_included is True:
-                # Both intersection boundaries are included.
-                if new_start > new_end:
-                    return TimeInterval.empty()
-            else:
-                # At least one intersection boundary is not included.
-                if new_start >= new_end:
-                    return TimeInterval.empty()
-                
-        return TimeInterval.from_boundaries(
-            start=new_start,
-            end=new_end,
-            start_included=new_start_included,
-            end_included=new_end_included
-        )
+        # The intersection starts at the larger start key and ends at
+        # the smaller end key (see '_start_key'). On a tie, the boundary
+        # of 'self' is taken.
+        a = self if self._start_key >= other._start_key else other
+        b = self if self._end_key <= other._end_key else other
+
+        if not a._start_key < b._end_key:
+            # Also holds if either interval is empty.
+            return TimeInterval._EMPTY
+
+        # A boundary at the same moment as that of 'self' is taken
+        # from 'self', whatever its inclusion, so that the result keeps
+        # the time zone of 'self'.
+        start, end = a._start, b._end
+        if (
+            a is not self and start is not None and self._start is not None
+            and start._us == self._start._us
+        ):
+            start = self._start
+        if (
+            b is not self and end is not None and self._end is not None
+            and end._us == self._end._us
+        ):
+            end = self._end
+
+        return TimeInterval._spanning(a, b, start, end)
+
+
+    @staticmethod
+    def _spanning(
+        a: TimeInterval,
+        b: TimeInterval,
+        start: Timestamp | None,
+        end: Timestamp | None
+    ) -> TimeInterval:
+        '''Creates the interval from the start of 'a' to the end of 'b'.
+
+        The boundaries 'start' and 'end' are the moments of those of 'a'
+        and 'b', possibly in other time zones. The result must be
+        non-empty, i.e. 'a._start_key < b._end_key'.'''
+
+        if a is b and start is a._start and end is b._end:
+            return a
+
+        kind = TimeInterval._KINDS_BY_BOUNDARIES[
+            (a._flags & (_START_SPECIFIED | _START_INCLUDED))
+            | (b._flags & (_END_SPECIFIED | _END_INCLUDED))
+        ]
+
+        if kind is TimeInterval.Kind.CLOSED and start._us == end._us:    # type: ignore[union-attr]
+            return TimeInterval._unchecked(TimeInterval.Kind.POINT, start, start)
+
+        return TimeInterval._unchecked(kind, start, end)
     
 
     @classmethod
     def empty(cls) -> TimeInterval:
         '''Creates empty time interval.'''
 
-        return cls(_kind=TimeInterval.Kind.EMPTY, _start=None, _end=None)
+        return TimeInterval._EMPTY
 
 
     @classmethod
     def point(cls, moment: Timestamp) -> TimeInterval:
         '''Creates a point. It corresponds to an instantaneous event.'''
 
-        return cls(_kind=TimeInterval.Kind.POINT, _start=moment, _end=moment)
+        if moment is None:
+            raise ValueError('The time interval has been set incorrectly.')
+
+        return cls._unchecked(TimeInterval.Kind.POINT, moment, moment)
     
 
     @classmethod
@@ -600,7 +796,7 @@ class TimeInterval:
                 'which is not correct.'
             )
 
-        return cls(_kind=TimeInterval.Kind.OPEN, _start=start, _end=end)
+        return cls._unchecked(TimeInterval.Kind.OPEN, start, end)
     
 
     @classmethod
@@ -615,7 +811,7 @@ class TimeInterval:
                 'or it\'s a point.'
             )
 
-        return cls(_kind=TimeInterval.Kind.CLOSED, _start=start, _end=end)
+        return cls._unchecked(TimeInterval.Kind.CLOSED, start, end)
     
 
     @classmethod
@@ -628,7 +824,7 @@ class TimeInterval:
                 'which is not correct.'
             )
 
-        return cls(_kind=TimeInterval.Kind.CLOSED_OPEN, _start=start, _end=end)
+        return cls._unchecked(TimeInterval.Kind.CLOSED_OPEN, start, end)
     
 
     @classmethod
@@ -641,62 +837,80 @@ class TimeInterval:
                 'which is not correct.'
             )
 
-        return cls(_kind=TimeInterval.Kind.OPEN_CLOSED, _start=start, _end=end)
+        return cls._unchecked(TimeInterval.Kind.OPEN_CLOSED, start, end)
     
 
     @classmethod
     def rightclosed(cls, start: Timestamp) -> TimeInterval:
         '''Creates a closed right-ray.'''
 
-        return cls(_kind=TimeInterval.Kind.RIGHT_CLOSED, _start=start)
+        if start is None:
+            raise ValueError('The time interval has been set incorrectly.')
+
+        return cls._unchecked(TimeInterval.Kind.RIGHT_CLOSED, start)
     
 
     @classmethod
     def rightopen(cls, start: Timestamp) -> TimeInterval:
         '''Creates an open right-ray.'''
 
-        return cls(_kind=TimeInterval.Kind.RIGHT_OPEN, _start=start)
+        if start is None:
+            raise ValueError('The time interval has been set incorrectly.')
+
+        return cls._unchecked(TimeInterval.Kind.RIGHT_OPEN, start)
     
 
     @classmethod
     def right_ray(cls, start: Timestamp, start_included: bool) -> TimeInterval:
         '''Creates a right-ray with a specified left boundary kind.'''
 
+        if start is None:
+            raise ValueError('The time interval has been set incorrectly.')
+
         if start_included:
-            return cls(_kind=TimeInterval.Kind.RIGHT_CLOSED, _start=start)
+            return cls._unchecked(TimeInterval.Kind.RIGHT_CLOSED, start)
         else:
-            return cls(_kind=TimeInterval.Kind.RIGHT_OPEN, _start=start)
+            return cls._unchecked(TimeInterval.Kind.RIGHT_OPEN, start)
     
 
     @classmethod
     def leftclosed(cls, end: Timestamp) -> TimeInterval:
         '''Creates a closed left ray.'''
 
-        return cls(_kind=TimeInterval.Kind.LEFT_CLOSED, _end=end)
+        if end is None:
+            raise ValueError('The time interval has been set incorrectly.')
+
+        return cls._unchecked(TimeInterval.Kind.LEFT_CLOSED, None, end)
     
 
     @classmethod
     def leftopen(cls, end: Timestamp) -> TimeInterval:
         '''Creates an open left ray.'''
 
-        return cls(_kind=TimeInterval.Kind.LEFT_OPEN, _end=end)
+        if end is None:
+            raise ValueError('The time interval has been set incorrectly.')
+
+        return cls._unchecked(TimeInterval.Kind.LEFT_OPEN, None, end)
     
 
     @classmethod
     def left_ray(cls, end: Timestamp, end_included: bool) -> TimeInterval:
         '''Creates a left-ray with a specified right boundary kind.'''
 
+        if end is None:
+            raise ValueError('The time interval has been set incorrectly.')
+
         if end_included:
-            return cls(_kind=TimeInterval.Kind.LEFT_CLOSED, _end=end)
+            return cls._unchecked(TimeInterval.Kind.LEFT_CLOSED, None, end)
         else:
-            return cls(_kind=TimeInterval.Kind.LEFT_OPEN, _end=end)
+            return cls._unchecked(TimeInterval.Kind.LEFT_OPEN, None, end)
     
 
     @classmethod
     def timeline(cls) -> TimeInterval:
         '''Creates the entire timeline.'''
 
-        return cls(_kind=TimeInterval.Kind.TIMELINE)
+        return TimeInterval._TIMELINE
     
 
     @classmethod
@@ -736,9 +950,9 @@ class TimeInterval:
                 
                 if start == end:
                     # The interval is a point.
-                    return TimeInterval.point(start)
+                    return cls._unchecked(TimeInterval.Kind.POINT, start, start)
                 
-                return TimeInterval.closed(start, end)
+                return cls._unchecked(TimeInterval.Kind.CLOSED, start, end)
             
             elif start_included and not end_included:
                 # The start of the interval is included, but the end
@@ -751,7 +965,7 @@ class TimeInterval:
                         'cannot occur after the end, or coincide with it.'
                     )
 
-                return TimeInterval.closedopen(start, end)
+                return cls._unchecked(TimeInterval.Kind.CLOSED_OPEN, start, end)
             
             elif not start_included and end_included:
                 # The start of the interval is not included, but the end
@@ -764,7 +978,7 @@ class TimeInterval:
                         'cannot occur after the end, or coincide with it.'
                     )
 
-                return TimeInterval.openclosed(start, end)
+                return cls._unchecked(TimeInterval.Kind.OPEN_CLOSED, start, end)
             
             else:
                 # Both the start and end of the interval
@@ -777,7 +991,7 @@ class TimeInterval:
                         'occur after the end, or coincide with it.'
                     )
 
-                return TimeInterval.open(start, end)
+                return cls._unchecked(TimeInterval.Kind.OPEN, start, end)
                 
         elif start is not None and end is None:
             # The start of the interval is specified, but not the end.
@@ -793,12 +1007,12 @@ class TimeInterval:
                 # The start of the interval is included. This is a right
                 # closed ray.
 
-                return TimeInterval.rightclosed(start)
+                return cls._unchecked(TimeInterval.Kind.RIGHT_CLOSED, start)
             else:
                 # The start of the interval is not included. This is
                 # a right open ray.
                 
-                return TimeInterval.rightopen(start)
+                return cls._unchecked(TimeInterval.Kind.RIGHT_OPEN, start)
             
         elif start is None and end is not None:
             # The start of the interval is not specified, but
@@ -814,12 +1028,12 @@ class TimeInterval:
                 # The end of the interval is included. This is a left
                 # closed ray.
 
-                return TimeInterval.leftclosed(end)
+                return cls._unchecked(TimeInterval.Kind.LEFT_CLOSED, None, end)
             else:
                 # The end of the interval is not included. This is
                 # a left open ray.
                 
-                return TimeInterval.leftopen(end)
+                return cls._unchecked(TimeInterval.Kind.LEFT_OPEN, None, end)
             
         else:
             # The start and end of the interval are not specified.
@@ -833,7 +1047,7 @@ class TimeInterval:
             
             # If both boundaries are not specified, the interval
             # is considered to be the entire timeline.
-            return TimeInterval.timeline()
+            return TimeInterval._TIMELINE
     
 
     @classmethod
@@ -843,60 +1057,21 @@ class TimeInterval:
         This is not a cover in the strict topological sense because
         it creates a single interval rather than a union.'''
 
-        # Remove empty intervals.
-        nonempty_intervals = [i for i in intervals if not i.is_empty]
-
-        # If there are no non-empty intervals, then the cover is empty.
-        if not nonempty_intervals:
+        if not intervals:
             return cls.empty()
 
-        # Find the left boundary, i.e. minimal start. ('None'
-        # is considered the smallest because it denotes a boundary that
-        # lies at infinity.)
-        def start_key(i: TimeInterval):
-            return (i.start is not None, i.start)
+        # The cover runs from the smallest start key to the largest end
+        # key. An included boundary has the smaller start key and the
+        # larger end key, so it wins over an excluded one at the same
+        # moment. Empty intervals have the keys '+inf' and '-inf' and are
+        # only picked if all intervals are empty.
+        first = min(intervals, key=_by_start_key)
+        last = max(intervals, key=_by_end_key)
 
-        leftmost = min(nonempty_intervals, key=start_key)
-
-        start = leftmost.start
-
-        # The start is included if it is included in at least one
-        # of the intervals.
-        start_included = (
-            None if start is None
-            else any(
-                i.start == start and i.is_start_included
-                for i in nonempty_intervals
-            )
-        )
-
-        # Find the right boundary, i.e. maximal end. ('None'
-        # is considered the largest because it denotes a boundary that
-        # lies at infinity.)
-        def end_key(i: TimeInterval):
-            return (i.end is None, i.end)
-
-        rightmost = max(nonempty_intervals, key=end_key)
-
-        end = rightmost.end
-
-        # The end is included if it is included in at least one
-        # of the intervals.
-        end_included = (
-            None if end is None
-            else any(
-                i.end == end and i.is_end_included
-                for i in nonempty_intervals
-            )
-        )
+        if first._kind is TimeInterval.Kind.EMPTY:
+            return cls.empty()
 
-        # Construct the covering interval.
-        return cls.from_boundaries(
-            start=start,
-            end=end,
-            start_included=start_included,
-            end_included=end_included
-        )
+        return TimeInterval._spanning(first, last, first._start, last._end)
     
 
     def to_the_right(self) -> TimeInterval:
@@ -992,59 +1167,25 @@ class TimeInterval:
     def closure(self) -> TimeInterval:
         '''Creates a topological closure of the interval.'''
 
-        match self._kind:
-            case (
-                TimeInterval.Kind.OPEN |
-                TimeInterval.Kind.CLOSED_OPEN |
-                TimeInterval.Kind.OPEN_CLOSED
-            ):
-                return TimeInterval(
-                    _kind=TimeInterval.Kind.CLOSED,
-                    _start=self.start,
-                    _end=self.end
-                )
-            case TimeInterval.Kind.RIGHT_OPEN:
-                return TimeInterval(
-                    _kind=TimeInterval.Kind.RIGHT_CLOSED,
-                    _start=self.start
-                )
-            case TimeInterval.Kind.LEFT_OPEN:
-                return TimeInterval(
-                    _kind=TimeInterval.Kind.LEFT_CLOSED,
-                    _end=self.end
-                )
-            case _:
-                return self
+        kind = TimeInterval._CLOSURE_KINDS.get(self._kind)
+        if kind is None:
+            # The interval is closed.
+            return self
+
+        return TimeInterval._unchecked(kind, self._start, self._end)
     
 
     def interior(self) -> TimeInterval:
         '''Creates a topological interior of a given interval.'''
 
-        match self._kind:
-            case TimeInterval.Kind.POINT:
-                return TimeInterval.empty()
-            case (
-                TimeInterval.Kind.CLOSED |
-                TimeInterval.Kind.CLOSED_OPEN |
-                TimeInterval.Kind.OPEN_CLOSED
-            ):
-                return TimeInterval(
-                    _kind=TimeInterval.Kind.OPEN,
-                    _start=self.start,
-                    _end=self.end
-                )
-            case TimeInterval.Kind.RIGHT_CLOSED:
-                return TimeInterval(
-                    _kind=TimeInterval.Kind.RIGHT_OPEN,
-                    _start=self.start
-                )
-            case TimeInterval.Kind.LEFT_CLOSED:
-                return TimeInterval(
-                    _kind=TimeInterval.Kind.LEFT_OPEN,
-                    _end=self.end
-                )
-            case _:
-                return self
+        kind = TimeInterval._INTERIOR_KINDS.get(self._kind)
+        if kind is None:
+            # The interval is open.
+            return self
+        if kind is TimeInterval.Kind.EMPTY:
+            return TimeInterval._EMPTY
+
+        return TimeInterval._unchecked(kind, self._start, self._end)
 
 
     @property
@@ -1068,21 +1209,21 @@ class TimeInterval:
         Here, boundedness is understood in a mathematical sense.
         Therefore an empty interval is considered to be bounded.'''
 
-        return self._kind in TimeInterval._BOUNDED_KINDS
+        return bool(self._flags & _BOUNDED)
     
 
     @property
     def is_left_bounded(self) -> bool:
         '''Checks whether the interval is bounded on the left.'''
 
-        return self._kind in TimeInterval._LEFT_BOUNDED_KINDS
+        return bool(self._flags & _LEFT_BOUNDED)
     
 
     @property
     def is_right_bounded(self) -> bool:
         '''Checks whether the interval is bounded on the right.'''
 
-        return self._kind in TimeInterval._RIGHT_BOUNDED_KINDS
+        return bool(self._flags & _RIGHT_BOUNDED)
     
 
     @property
@@ -1107,7 +1248,7 @@ class TimeInterval:
         an empty interval, a bounded open interval, an open ray
         and the entire timeline are all considered to be open sets.'''
 
-        return self._kind in TimeInterval._OPEN_KINDS
+        return bool(self._flags & _OPEN)
     
 
     @property
@@ -1119,7 +1260,7 @@ class TimeInterval:
         a closed ray and the entire timeline are all considered
         to be closed sets.'''
 
-        return self._kind in TimeInterval._CLOSED_KINDS
+        return bool(self._flags & _CLOSED)
     
 
     @property
@@ -1144,14 +1285,14 @@ class TimeInterval:
     def is_start_specified(self) -> bool:
         '''Returns whether the start of the interval is specified.'''
 
-        return self._kind in TimeInterval._START_SPECIFIED_KINDS
+        return bool(self._flags & _START_SPECIFIED)
 
 
     @property
     def is_end_specified(self) -> bool:
         '''Returns whether the end of the interval is specified.'''
 
-        return self._kind in TimeInterval._END_SPECIFIED_KINDS
+        return bool(self._flags & _END_SPECIFIED)
 
 
     @property
@@ -1160,8 +1301,9 @@ class TimeInterval:
         it is included in the interval or not. If the start
         is not specified, it returns 'None'.'''
 
-        if self._kind in TimeInterval._START_SPECIFIED_KINDS:
-            return self._kind in TimeInterval._START_INCLUDED_KINDS
+        kind_flags = self._flags
+        if kind_flags & _START_SPECIFIED:
+            return bool(kind_flags & _START_INCLUDED)
         else:
             return None
     
@@ -1172,8 +1314,9 @@ class TimeInterval:
         it is included in the interval or not. If the end
         is not specified, it returns 'None'.'''
 
-        if self._kind in TimeInterval._END_SPECIFIED_KINDS:
-            return self._kind in TimeInterval._END_INCLUDED_KINDS
+        kind_flags = self._flags
+        if kind_flags & _END_SPECIFIED:
+            return bool(kind_flags & _END_INCLUDED)
         else:
             return None
 
@@ -1204,23 +1347,12 @@ class TimeInterval:
         interval), returns 'None'. The duration of an empty interval
         is zero.'''
 
-        if self.is_bounded:
-            # The interval is bounded.
-            if self.is_empty:
-                # The interval is empty.
-                return datetime.timedelta()
-            else:
-                # The interval is bounded and non-empty.
-                if self._start is None or self._end is None:
-                    # At least one of the interval boundaries has not
-                    # been specified, which contradicts its boundedness.
-                    raise ValueError(
-                        'It is impossible to determine the start or end of the time interval.'
-                    )
+        duration_us = self._duration_us
 
-                return self._end - self._start
-        else:
+        if duration_us is None:
             return None
+        
+        return datetime.timedelta(microseconds=duration_us)
 
 
     def contains_timestamp(self, moment: Timestamp) -> bool:
@@ -1230,92 +1362,38 @@ class TimeInterval:
         if not isinstance(moment, Timestamp):
             return False
 
-        if self.is_empty:
-            return False
+        # As a point, the moment has the start key '2 * us' and the end
+        # key '2 * us + 1' (see '_start_key'), so this is
+        # 'contains_timeinterval' for integers. The keys of the empty
+        # interval make the check fail on their own.
+        return self._start_key <= 2 * moment._us < self._end_key
+    
 
-        if self.is_timeline:
-            return True
-        # From this point onwards, the interval is considered to be
-        # non-empty, but not the entire timeline.
-        
-        left_ok = True
-        right_ok = True
+    def contains_many(self, moments: Iterable[Timestamp]) -> list[bool]:
+        '''Checks for each of the given moments in time whether it falls
+        within the time interval.
 
-        if self.start is not None:
-            if self.is_start_included:
-                left_ok = moment >= self.start
-            else:
-                left_ok = moment > self.start
+        The keys of the interval are read once for all moments.'''
 
-        if self.end is not None:
-            if self.is_end_included:
-                right_ok = moment <= self.end
-            else:
-                right_ok = moment < self.end
-            
-        return left_ok and right_ok
+        start_key, end_key = self._start_key, self._end_key
+        return [
+            isinstance(m, Timestamp) and start_key <= 2 * m._us < end_key
+            for m in moments
+        ]
     
 
     def contains_timeinterval(self, interval: TimeInterval) -> bool:
         '''Checks whether this interval contains another one.'''
 
-        # Any contains an empty interval.
-        if interval.is_empty:
-            return True
-        # From this point onwards, we will consider 'other' to be
-        # non-empty. An empty interval cannot contain a non-empty one.
-
-        if self.is_empty:
-            return False
-
-        # Checking the left boundary.
-        if interval.start is not None:
-            # 'other' is bounded on the left.
-            if self.start is None:
-                # 'self' is unbounded on the left.
-                left_ok = True
-            else:
-                # 'self' is bounded on the left.
-
-                if self.start < interval.start:
-                    left_ok = True
-                elif self.start == interval.start:
-                    left_ok = (
-                        self.is_start_included
-                        or not interval.is_start_included
-                    )
-                else:
-                    left_ok = False
-        else:
-            # 'other' is unbounded on the left.
-            left_ok = self.start is None
-
-        if not left_ok:
-            return False
-
-        # Checking the right boundary.
-        if interval.end is not None:
-            # 'other' is bounded on the right.
-            if self.end is None:
-                # 'self' is unbounded on the right.
-                right_ok = True
-            else:
-                # 'self' is bounded on the right.
-
-                if self.end > interval.end:
-                    right_ok = True
-                elif self.end == interval.end:
-                    right_ok = (
-                        self.is_end_included
-                        or not interval.is_end_included
-                    )
-                else:
-                    right_ok = False
-        else:
-            # 'other' is unbounded on the right.
-            right_ok = self.end is None
-
-        return right_ok
+        # The packed keys order the boundaries together with their
+        # inclusion, so the start of 'self' must not be greater than
+        # that of 'interval', and the end must not be smaller. The keys
+        # '+inf' and '-inf' of the empty interval make it contained
+        # in any interval, and make it contain only itself.
+        return (
+            self._start_key <= interval._start_key
+            and interval._end_key <= self._end_key
+        )
 
 
     def contains(self, other: Timestamp | TimeInterval) -> bool:
@@ -1343,21 +1421,9 @@ class TimeInterval:
         This is automatically true if any of the time intervals
         are empty.'''
 
-        if self.is_empty or other.is_empty:
-            return True
-        # From this point onwards, both intervals are considered
-        # to be non-empty.
-
-        if self.end is not None and other.start is not None:
-            # 'self' is bounded on the right and 'other' is bounded
-            # on the left.
-
-            if self.end < other.start:
-                return True
-            if self.end == other.start:
-                return self.is_end_included is False or other.is_start_included is False
-            
-        return False
+        # See '_start_key' and '_end_key'. With the keys '+inf' and
+        # '-inf', an empty interval passes the check on either side.
+        return self._end_key <= other._start_key
     
 
     def is_right_of(self, other: TimeInterval) -> bool:
@@ -1367,21 +1433,9 @@ class TimeInterval:
         This is automatically true if any of the time intervals
         are empty.'''
 
-        if self.is_empty or other.is_empty:
-            return True
-        # From this point onwards, both intervals are considered
-        # to be non-empty.
-
-        if other.end is not None and self.start is not None:
-            # 'other' is bounded on the right and 'self' is bounded
-            # on the left.
-
-            if other.end < self.start:
-                return True
-            if other.end == self.start:
-                return other.is_end_included is False or self.is_start_included is False
-            
-        return False
+        # See '_start_key' and '_end_key'. With the keys '+inf' and
+        # '-inf', an empty interval passes the check on either side.
+        return other._end_key <= self._start_key
     
 
     def is_left_of_disconnectedly(self, other: TimeInterval) -> bool:
@@ -1392,21 +1446,16 @@ class TimeInterval:
         This is not true if at least one of the intervals is empty,
         because a disconnected union is required.'''
 
-        if self.is_empty or other.is_empty:
+        if (
+            self._kind is TimeInterval.Kind.EMPTY
+            or other._kind is TimeInterval.Kind.EMPTY
+        ):
             return False
         # From this point onwards, both intervals are considered
         # to be non-empty.
-        
-        if self.end is not None and other.start is not None:
-            # 'self' is bounded on the right and 'other' is bounded
-            # on the left.
 
-            if self.end < other.start:
-                return True
-            if self.end == other.start:
-                return self.is_end_included is False and other.is_start_included is False
-            
-        return False
+        # See '_start_key' and '_end_key'.
+        return self._end_key < other._start_key
     
 
     def is_right_of_disconnectedly(self, other: TimeInterval) -> bool:
@@ -1417,41 +1466,29 @@ class TimeInterval:
         This is not true if at least one of the intervals is empty,
         because a disconnected union is required.'''
 
-        if self.is_empty or other.is_empty:
+        if (
+            self._kind is TimeInterval.Kind.EMPTY
+            or other._kind is TimeInterval.Kind.EMPTY
+        ):
             return False
         # From this point onwards, both intervals are considered
         # to be non-empty.
-        
-        if other.end is not None and self.start is not None:
-            # 'other' is bounded on the right and 'self' is bounded
-            # on the left.
 
-            if other.end < self.start:
-                return True
-            if other.end == self.start:
-                return other.is_end_included is False and self.is_start_included is False
-            
-        return False
+        # See '_start_key' and '_end_key'.
+        return other._end_key < self._start_key
     
 
     def overlaps(self, other: TimeInterval) -> bool:
         '''Check if two intervals overlap (have non-empty
         intersection).'''
         
-        if self.is_empty or other.is_empty:
-            return False
-        # From this point onwards, both intervals are considered
-        # to be non-empty.
-
-        # Check whether 'self' is completely to the left of 'other'.
-        if self.is_left_of(other):
-            return False
-
-        # Check whether 'other' is completely to the left of 'self'.
-        if other.is_left_of(self):
-            return False
-
-        return True
+        # Neither interval may lie completely to the left of the other
+        # one, i.e. neither 'is_left_of' may hold (see '_start_key'
+        # and '_end_key'). An empty interval fails the check on its own.
+        return (
+            other._start_key < self._end_key
+            and self._start_key < other._end_key
+        )
     
 
     def touches(self, other: TimeInterval) -> bool:
@@ -1460,26 +1497,31 @@ class TimeInterval:
         In other words, it checks whether they are non-empty and whether
         their union is connected.'''
 
-        if self.is_empty or other.is_empty:
+        if (
+            self._kind is TimeInterval.Kind.EMPTY
+            or other._kind is TimeInterval.Kind.EMPTY
+        ):
             return False
         # From this point onwards, both intervals are considered
         # to be non-empty.
 
-        # Check whether 'self' is completely to the left of 'other'
-        # and their union is disconnected.
-        if self.is_left_of_disconnectedly(other):
-            return False
+        # Neither interval may lie completely to the left of the other
+        # one with a disconnected union, i.e. neither
+        # 'is_left_of_disconnectedly' may hold (see '_start_key'
+        # and '_end_key').
+        return (
+            other._start_key <= self._end_key
+            and self._start_key <= other._end_key
+        )
 
-        # Check whether 'other' is completely to the left of 'self'
-        # and their union is disconnected.
-        if other.is_left_of_disconnectedly(self):
-            return False
 
-        return True
+
+TimeInterval._EMPTY = TimeInterval._unchecked(TimeInterval.Kind.EMPTY)
+TimeInterval._TIMELINE = TimeInterval._unchecked(TimeInterval.Kind.TIMELINE)
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeSet:
     '''Disjoint union of time intervals 'TimeInterval'.
     
@@ -1490,37 +1532,86 @@ class TimeSet:
 
     _intervals: tuple[TimeInterval, ...]
 
+    # The bitwise 'and' of the '_flags' of all intervals, computed
+    # once on creation. A bit is set if the property holds for every
+    # interval, in particular for the empty set.
+    _flags: int = field(init=False, repr=False, compare=False)
+
+    # The string representation, computed on first use.
+    _str: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Shared instances of the empty set and the entire time line.
+    # They are created once the class is defined.
+    _EMPTY: ClassVar[TimeSet]
+    _TIMELINE: ClassVar[TimeSet]
+
 
     def _is_valid(self) -> bool:
-        '''Checks whether the 'TimeSet' is set correctly.'''
+        '''Checks whether the 'TimeSet' is set correctly.
 
-        # 'TimeSet' must not contain any empty intervals.
-        for i in self._intervals:
-            if i.is_empty:
+        If it is, also sets '_flags', which is accumulated in the same
+        pass.'''
+
+        # Both conditions are checked in a single pass, reading
+        # the fields of the intervals directly.
+        l: TimeInterval | None = None
+        flags = _ALL_FLAGS
+
+        for r in self._intervals:
+            # 'TimeSet' must not contain any empty intervals.
+            if r._kind is TimeInterval.Kind.EMPTY:
                 return False
 
-        # The intervals in 'TimeSet' must be chronologically ordered,
-        # and all their pairwise unions must be disconnected.
-        for l, r in zip(self._intervals, self._intervals[1:]):
-            if not l.is_left_of_disconnectedly(r):
+            # The intervals in 'TimeSet' must be chronologically ordered,
+            # and all their pairwise unions must be disconnected, i.e.
+            # 'l.is_left_of_disconnectedly(r)' must hold.
+            if l is not None and not l._end_key < r._start_key:
                 return False
-        
+
+            flags &= r._flags
+            l = r
+
+        object.__setattr__(self, '_flags', flags)
         return True
     
 
     def __init__(self, *intervals: TimeInterval):
         object.__setattr__(self, '_intervals', tuple(intervals))
+        object.__setattr__(self, '_str', None)
 
         if not self._is_valid():
             raise ValueError('The \'TimeSet\' has been set incorrectly.')
     
 
+    @classmethod
+    def _unchecked(cls, intervals: list[TimeInterval]) -> TimeSet:
+        '''Creates a time set without validating it.
+
+        Only for internal use, when the intervals are already known
+        to be non-empty, ordered and pairwise disconnected.'''
+
+        flags = _ALL_FLAGS
+        for i in intervals:
+            flags &= i._flags
+
+        timeset = object.__new__(cls)
+        object.__setattr__(timeset, '_intervals', tuple(intervals))
+        object.__setattr__(timeset, '_flags', flags)
+        object.__setattr__(timeset, '_str', None)
+        return timeset
+    
+
     def __str__(self) -> str:
-        if self.is_empty:
-            # Returns the empty set symbol.
-            return '\u2205'
-        else:
-            return ' \u2294 '.join(map(str, self._intervals))
+        string = self._str
+        if string is None:
+            if self.is_empty:
+                # The empty set symbol.
+                string = '\u2205'
+            else:
+                string = ' \u2294 '.join(map(str, self._intervals))
+            object.__setattr__(self, '_str', string)
+
+        return string
     
 
     def __bool__(self) -> bool:
@@ -1531,8 +1622,12 @@ class TimeSet:
 
     def __contains__(self, other: object) -> bool:
 
-        if isinstance(other, Timestamp | TimeInterval | TimeSet):
-            return self.contains(other)
+        if isinstance(other, Timestamp):
+            return self.contains_timestamp(other)
+        elif isinstance(other, TimeInterval):
+            return self.contains_timeinterval(other)
+        elif isinstance(other, TimeSet):
+            return self.contains_timeset(other)
         else:
             return False
     
@@ -1580,27 +1675,58 @@ class TimeSet:
         '''Checks whether the given moment in time falls within the time
         set.'''
 
-        return any(moment in c for c in self.components)
+        if not isinstance(moment, Timestamp):
+            return False
+
+        # As a point, the moment has the start key '2 * us' and the end
+        # key '2 * us + 1' (see 'TimeInterval._start_key'). The only
+        # component that can contain it is the last one starting
+        # no later, which is found by a binary search.
+        key = 2 * moment._us
+        index = bisect_right(self._intervals, key, key=_by_start_key) - 1
+
+        return index >= 0 and key < self._intervals[index]._end_key
     
 
     def contains_timeinterval(self, interval: TimeInterval) -> bool:
         '''Checks whether the time set contains a time interval.'''
 
-        return any(interval.is_contained_in(c) for c in self.components)
+        intervals = self._intervals
+        if interval._kind is TimeInterval.Kind.EMPTY:
+            # Any non-empty component contains an empty interval.
+            return bool(intervals)
+
+        # The components are disjoint, so the only one that can contain
+        # the interval is the last one starting no later.
+        index = bisect_right(intervals, interval._start_key, key=_by_start_key) - 1
+
+        return index >= 0 and interval._end_key <= intervals[index]._end_key
     
 
     def contains_timeset(self, timeset: TimeSet) -> bool:
         '''Checks whether the time set contains another one.'''
 
+        # The components are non-empty, so the interval checks reduce
+        # to comparisons of their packed keys.
+        a, b = self._intervals, timeset._intervals
+        na, nb = len(a), len(b)
         i, j = 0, 0
 
-        while j < timeset.components_number:
-            if i >= self.components_number:
+        while j < nb:
+            if i >= na:
                 return False
 
-            if self.components[i].contains(timeset.components[j]):
+            self_interval = a[i]
+            other_interval = b[j]
+
+            if (
+                self_interval._start_key <= other_interval._start_key
+                and other_interval._end_key <= self_interval._end_key
+            ):
+                # 'self_interval' contains 'other_interval'.
                 j += 1
-            elif self.components[i].is_left_of(timeset.components[j]):
+            elif self_interval._end_key <= other_interval._start_key:
+                # 'self_interval' lies to the left of 'other_interval'.
                 i += 1
             else:
                 return False
@@ -1651,7 +1777,8 @@ class TimeSet:
                 if intersection_interval.is_nonempty:
                     intersection_intervals.append(intersection_interval)
 
-        return TimeSet(*intersection_intervals)
+        # The pieces of disconnected components stay disconnected.
+        return TimeSet._unchecked(intersection_intervals)
 
     
     def intersection_with_timeset(self, other: TimeSet) -> TimeSet:
@@ -1663,35 +1790,38 @@ class TimeSet:
         # From this point onwards, time sets are considered to be
         # non-empty.
 
+        # The components are non-empty, so the relation checks reduce
+        # to comparisons of their packed keys.
+        a, b = self._intervals, other._intervals
+        na, nb = len(a), len(b)
         intersection_intervals: list[TimeInterval] = []
+        append = intersection_intervals.append
         i, j = 0, 0
 
-        while i < self.components_number and j < other.components_number:
-            self_interval = self._intervals[i]
-            other_interval = other._intervals[j]
+        while i < na and j < nb:
+            self_interval = a[i]
+            other_interval = b[j]
 
-            if self_interval.is_left_of(other_interval):
+            if self_interval._end_key <= other_interval._start_key:
+                # 'self_interval' lies to the left of 'other_interval'.
                 i += 1
-            elif self_interval.is_right_of(other_interval):
+            elif other_interval._end_key <= self_interval._start_key:
+                # 'self_interval' lies to the right of 'other_interval'.
                 j += 1
             else:
-                # The intervals overlap.
-
-                intersection_interval = self_interval & other_interval
-                if not intersection_interval.is_empty:
-                    intersection_intervals.append(intersection_interval)
+                # The intervals overlap, so their intersection is
+                # non-empty.
+                append(self_interval & other_interval)
 
                 # Increment the pointer of the interval that ends
-                # earlier.
-                if (
-                    (self_interval.end is None, self_interval.end) <
-                    (other_interval.end is None, other_interval.end)
-                ):
+                # earlier. An unspecified end has the key '+inf'.
+                if self_interval._end_key < other_interval._end_key:
                     i += 1
                 else:
                     j += 1
 
-        return TimeSet(*intersection_intervals)
+        # The pieces of disconnected components stay disconnected.
+        return TimeSet._unchecked(intersection_intervals)
     
 
     def overlaps_with_interval(self, interval: TimeInterval) -> bool:
@@ -1703,16 +1833,14 @@ class TimeSet:
         # From this point onwards, a time set and a time interval
         # are considered to be non-empty.
 
-        for i in self.components:
-            if i.is_left_of(interval):
-                continue
-            elif i.is_right_of(interval):
-                break
-            else:
-                # The intervals overlap.
-                return True
+        # The components are ordered by their ends as well, so the first
+        # one ending after the start of the interval is the only one
+        # to check: the components before it lie to the left of the
+        # interval, and those after it start even later.
+        intervals = self._intervals
+        index = bisect_right(intervals, interval._start_key, key=_by_end_key)
 
-        return False
+        return index < len(intervals) and intervals[index]._start_key < interval._end_key
     
 
     def overlaps_with_timeset(self, timeset: TimeSet) -> bool:
@@ -1724,15 +1852,21 @@ class TimeSet:
         # From this point onwards, time sets are considered to be
         # non-empty.
 
+        # The components are non-empty, so the relation checks reduce
+        # to comparisons of their packed keys.
+        a, b = self._intervals, timeset._intervals
+        na, nb = len(a), len(b)
         i, j = 0, 0
 
-        while i < self.components_number and j < timeset.components_number:
-            self_interval = self.components[i]
-            other_interval = timeset.components[j]
+        while i < na and j < nb:
+            self_interval = a[i]
+            other_interval = b[j]
 
-            if self_interval.is_left_of(other_interval):
+            if self_interval._end_key <= other_interval._start_key:
+                # 'self_interval' lies to the left of 'other_interval'.
                 i += 1
-            elif self_interval.is_right_of(other_interval):
+            elif other_interval._end_key <= self_interval._start_key:
+                # 'self_interval' lies to the right of 'other_interval'.
                 j += 1
             else:
                 return True
@@ -1759,30 +1893,36 @@ class TimeSet:
         if self.is_empty:
             return TimeSet.timeline()
 
+        # The gaps between the components come out in chronological
+        # order, and each pair of them is separated by a non-empty
+        # component, so they need no sorting or merging. Only the outer
+        # gaps can be empty.
         new_components: list[TimeInterval] = []
 
         new_components.append(self.first_component.to_the_left())
 
-        for f, s in zip(self._intervals, self._intervals[1:]):
+        for f, s in pairwise(self._intervals):
             new_components.append(TimeInterval.between(f, s))
 
         new_components.append(self.last_component.to_the_right())
 
-        return TimeSet.union(*new_components)
+        return TimeSet._unchecked([
+            c for c in new_components if c._kind is not TimeInterval.Kind.EMPTY
+        ])
 
 
     @classmethod
     def empty(cls) -> TimeSet:
         '''Creates empty time set.'''
 
-        return cls()
+        return TimeSet._EMPTY
     
 
     @classmethod
     def timeline(cls) -> TimeSet:
         '''Creates the entire time line.'''
 
-        return cls(TimeInterval.timeline())
+        return TimeSet._TIMELINE
 
 
     @classmethod
@@ -1790,50 +1930,70 @@ class TimeSet:
         '''Creates a 'TimeSet' as a union of time intervals.'''
 
         # Remove empty intervals.
-        nonempty_intervals = [i for i in intervals if i.is_nonempty]
+        nonempty_intervals = [
+            i for i in intervals if i._kind is not TimeInterval.Kind.EMPTY
+        ]
 
         # If there are no non-empty intervals, then the union is empty.
         if not nonempty_intervals:
             return TimeSet.empty()
 
-        # Sort intervals chronologically.
-        def sort_key(i: TimeInterval):
-            return (
-                i.start is not None, i.start,
-                i.end is None, i.end
-            )
-
-        nonempty_intervals.sort(key=sort_key)
-
-        # Group touching intervals.
-        components: list[list[TimeInterval]] = []
-        current_group = [nonempty_intervals[0]]
+        # Sort intervals chronologically by their packed start keys,
+        # which also puts an included start before an excluded one
+        # at the same moment.
+        nonempty_intervals.sort(key=_by_start_key)
+
+        # Merge touching intervals in a single pass, keeping only
+        # the state of the current component:
+        # - 'first' is its first interval, which has its start;
+        # - 'last' is the first interval reaching its end;
+        # - 'end_key' is the packed key of its end, so that the end
+        #   is included if it is included in any of the intervals.
+        # Each new interval is compared with the whole component rather
+        # than with its predecessor only.
+        merged_intervals: list[TimeInterval] = []
+        append = merged_intervals.append
+
+        def emit() -> None:
+            if first is last and end_key == last._end_key:
+                # The component is one of the intervals.
+                append(first)
+                return
+
+            start, end = first._start, last._end
+            append(TimeInterval.from_boundaries(
+                start=start,
+                end=end,
+                start_included=(
+                    None if start is None
+                    else bool(first._flags & _START_INCLUDED)
+                ),
+                end_included=None if end is None else bool(end_key % 2)
+            ))
+
+        first = last = nonempty_intervals[0]
+        end_key = first._end_key
 
         for interval in nonempty_intervals[1:]:
-            if current_group[-1].touches(interval):
-                # If the new interval touches the last interval
-                # in the group, add it to the group.
-
-                current_group.append(interval)
-            else:
-                # If the new interval does not touch the last interval
-                # in the group, we keep the previous group and create
-                # a new one that includes the new interval.
-
-                components.append(current_group)
-                current_group = [interval]
-
-        # Keep the last group.
-        components.append(current_group)
-
-        # Build minimal covers (connected components).
-        merged_intervals = [
-            TimeInterval.minimal_cover(*group)
-            for group in components
-        ]
-
-        # Construct 'TimeSet'.
-        return cls(*merged_intervals)
+            if end_key < interval._start_key:
+                # The interval lies disconnectedly to the right
+                # of the component, which is therefore complete.
+                emit()
+                first = last = interval
+                end_key = interval._end_key
+            elif end_key < interval._end_key:
+                # The interval touches the component and extends it.
+                if interval._end_key != end_key + 1 or end_key % 2:
+                    # The interval ends later, not just at the same
+                    # moment with the end included.
+                    last = interval
+                end_key = interval._end_key
+
+        # Keep the last component.
+        emit()
+
+        # Construct 'TimeSet'. The components are valid by construction.
+        return cls._unchecked(merged_intervals)
     
 
     @property
@@ -1857,13 +2017,9 @@ class TimeSet:
         Here, boundedness is understood in a mathematical sense.
         Therefore an empty set is considered bounded.'''
 
-        if self.is_empty:
-            return True
-        # From this point onwards, the set is considered
-        # to be non-empty.
-
-        # Check the first and last intervals for boundedness.
-        return self._intervals[0].is_bounded and self._intervals[-1].is_bounded
+        # Only the first and last intervals can be unbounded, so this
+        # is the same as checking them.
+        return bool(self._flags & _BOUNDED)
 
 
     @property
@@ -1887,24 +2043,16 @@ class TimeSet:
     def is_open(self) -> bool:
         '''Checks whether the time set is open.'''
 
-        if self.is_empty:
-            return True
-        # From this point onwards, the set is considered
-        # to be non-empty.
-
-        return all(i.is_open for i in self._intervals)
+        # A union of open intervals is open.
+        return bool(self._flags & _OPEN)
     
 
     @property
     def is_closed(self) -> bool:
         '''Checks whether the time set is closed.'''
 
-        if self.is_empty:
-            return True
-        # From this point onwards, the set is considered to be
-        # non-empty.
-
-        return all(i.is_closed for i in self._intervals)
+        # A finite union of closed intervals is closed.
+        return bool(self._flags & _CLOSED)
 
 
     @property
@@ -2004,17 +2152,32 @@ class TimeSet:
         set), returns 'None'. The duration of an empty time set
         is zero.'''
 
-        if not self.is_bounded:
+        total_us = self.duration_us()
+
+        if total_us is None:
+            return None
+
+        return datetime.timedelta(microseconds=total_us)
+    
+
+    def duration_us(self) -> int | None:
+        '''Determines the duration of the time set in microseconds.
+
+        Unlike 'duration', it sums plain integers and creates no
+        'timedelta' objects. Returns 'None' if the duration
+        is not defined.'''
+
+        if not self._flags & _BOUNDED:
             return None
 
-        total = datetime.timedelta()
+        total_us = 0
 
-        for c in self.components:
-            d = c.duration
+        for c in self._intervals:
+            d = c._duration_us
             assert d is not None
-            total += d
+            total_us += d
 
-        return total
+        return total_us
     
 
     def closure(self) -> TimeSet:
@@ -2026,4 +2189,9 @@ class TimeSet:
     def interior(self) -> TimeSet:
         '''Creates a topological interior of the time set.'''
 
-        return TimeSet.union(*map(TimeInterval.interior, self.components))
\ No newline at end of file
+        return TimeSet.union(*map(TimeInterval.interior, self.components))
+
+
+
+TimeSet._EMPTY = TimeSet()
+TimeSet._TIMELINE = TimeSet(TimeInterval._TIMELINE)